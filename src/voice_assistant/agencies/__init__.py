@@ -1,7 +1,7 @@
 import importlib
 import os
 
-from agency_swarm import Agency
+from agency_swarm import Agency, Agent
 
 
 def load_agencies() -> dict[str, Agency]:
@@ -25,8 +25,17 @@ def load_agencies() -> dict[str, Agency]:
 # Load all agencies
 AGENCIES: dict[str, Agency] = load_agencies()
 
-AGENCIES_AND_AGENTS_STRING = "\n".join(
-    f"Agency '{agency_name}' has the following agents: {', '.join(agent.name for agent in agency.agents)}"
+AGENCY_AGENT_INDEX: dict[str, dict[str, Agent]] = {
+    agency_name: {agent.name: agent for agent in agency.agents}
     for agency_name, agency in AGENCIES.items()
+}
+AGENCY_AGENT_NAMES: dict[str, str] = {
+    agency_name: ", ".join(agent_index)
+    for agency_name, agent_index in AGENCY_AGENT_INDEX.items()
+}
+
+AGENCIES_AND_AGENTS_STRING = "\n".join(
+    f"Agency '{agency_name}' has the following agents: {agent_names}"
+    for agency_name, agent_names in AGENCY_AGENT_NAMES.items()
 )
 print("Available Agencies and Agents:\n", AGENCIES_AND_AGENTS_STRING)  # Debug print
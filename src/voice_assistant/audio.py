@@ -1,6 +1,7 @@
 import asyncio
 import logging
 
+import numpy as np
 import pyaudio
 
 from voice_assistant.config import CHANNELS, FORMAT, RATE
@@ -25,7 +26,7 @@ class AudioPlayer:
         self.stream.write(audio_chunk)
 
         # Update energy for visualization
-        visual_interface.process_audio_data(audio_chunk)
+        visual_interface.process_audio_data(np.frombuffer(audio_chunk, dtype=np.int16))
 
         # Allow other tasks to run
         await asyncio.sleep(0)
@@ -17,6 +17,11 @@ CHUNK = 1024
 FORMAT = pyaudio.paInt16
 CHANNELS = 1
 RATE = 24000
+# Coalesce mic chunks into ~100ms appends, flushing at most 60ms after the first
+AUDIO_BATCH_BYTES = RATE * CHANNELS * pyaudio.get_sample_size(FORMAT) // 10
+AUDIO_BATCH_MAX_DELAY = 0.06
+# Keep at most ~500ms of unsent mic audio; older audio is dropped under backpressure
+MAX_AUDIO_BACKLOG_BYTES = RATE * CHANNELS * pyaudio.get_sample_size(FORMAT) // 2
 
 # Load personalization settings
 PERSONALIZATION_FILE = os.getenv("PERSONALIZATION_FILE", "./personalization.json")
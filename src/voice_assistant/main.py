@@ -1,14 +1,22 @@
 # src/voice_assistant/main.py
 import asyncio
-import json
+import contextlib
 import logging
 import os
+import random
+import socket
+import sys
 
-import pygame
+import numpy as np
+import orjson
+import pybase64
 import websockets
 from websockets.exceptions import ConnectionClosedError
 
 from voice_assistant.config import (
+    AUDIO_BATCH_BYTES,
+    AUDIO_BATCH_MAX_DELAY,
+    MAX_AUDIO_BACKLOG_BYTES,
     PREFIX_PADDING_MS,
     SESSION_INSTRUCTIONS,
     SILENCE_DURATION_MS,
@@ -16,13 +24,12 @@ from voice_assistant.config import (
 )
 from voice_assistant.microphone import AsyncMicrophone
 from voice_assistant.tools import TOOL_SCHEMAS
-from voice_assistant.utils import base64_encode_audio
 from voice_assistant.utils.log_utils import log_ws_event
-from voice_assistant.visual_interface import (
-    VisualInterface,
-    run_visual_interface,
+from voice_assistant.visual_interface import VisualInterfaceProcess
+from voice_assistant.websocket_handler import (
+    RealtimeClientProtocol,
+    process_ws_messages,
 )
-from voice_assistant.websocket_handler import process_ws_messages
 
 # Set up logging
 logging.basicConfig(
@@ -32,28 +39,122 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+API_KEY = os.getenv("OPENAI_API_KEY")
+REALTIME_URL = (
+    "wss://api.openai.com/v1/realtime?model=gpt-4o-realtime-preview-2024-10-01"
+)
+REALTIME_HEADERS = {
+    "Authorization": f"Bearer {API_KEY}",
+    "OpenAI-Beta": "realtime=v1",
+}
 
-async def realtime_api():
-    while True:
-        try:
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
-                logger.error("Please set the OPENAI_API_KEY in your .env file.")
+# Audio appends are built by wrapping the base64 payload in pre-encoded JSON
+APPEND_EVENT = {"type": "input_audio_buffer.append"}
+APPEND_PREFIX = b'{"type":"input_audio_buffer.append","audio":"'
+APPEND_SUFFIX = b'"}'
+# Large enough for the biggest batch the microphone's backlog limit allows
+APPEND_SCRATCH_SIZE = (
+    len(APPEND_PREFIX) + (MAX_AUDIO_BACKLOG_BYTES + 2) // 3 * 4 + len(APPEND_SUFFIX)
+)
+
+
+def _encode_append_event(scratch: bytearray, pcm: np.ndarray) -> memoryview:
+    """Fill scratch with the append event for pcm and return a view of it.
+
+    scratch must already start with APPEND_PREFIX. Release the returned view
+    before the next call so scratch can grow if a larger batch comes along.
+    """
+    payload = pybase64.b64encode(pcm)
+    start = len(APPEND_PREFIX)
+    end = start + len(payload)
+    size = end + len(APPEND_SUFFIX)
+    if len(scratch) < size:
+        scratch.extend(bytes(size - len(scratch)))
+    scratch[start:end] = payload
+    scratch[end:size] = APPEND_SUFFIX
+    return memoryview(scratch)[:size]
+
+
+async def _drain(mic: AsyncMicrophone, exit_event: asyncio.Event, websocket):
+    """Yield batches of microphone audio as they arrive until exit_event is set.
+
+    Audio is left in the microphone's ring buffer until AUDIO_BATCH_BYTES is
+    reached or AUDIO_BATCH_MAX_DELAY has passed since data became available.
+    While the socket's write buffer is backed up nothing is read, so the ring
+    buffer's drop-oldest policy keeps latency bounded.
+    """
+    loop = asyncio.get_running_loop()
+    exit_wait = asyncio.ensure_future(exit_event.wait())
+    try:
+        while True:
+            data_wait = asyncio.ensure_future(mic.data_ready.wait())
+            done, _ = await asyncio.wait(
+                {data_wait, exit_wait}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if data_wait not in done:
+                data_wait.cancel()
                 return
 
-            exit_event = asyncio.Event()
+            deadline = loop.time() + AUDIO_BATCH_MAX_DELAY
+            while mic.buffered_bytes < AUDIO_BATCH_BYTES and not exit_event.is_set():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                mic.data_ready.clear()
+                try:
+                    await asyncio.wait_for(mic.data_ready.wait(), timeout=remaining)
+                except TimeoutError:
+                    break
+
+            mic.log_dropped()
+            write_backlog = websocket.transport.get_write_buffer_size()
+            if write_backlog > MAX_AUDIO_BACKLOG_BYTES:
+                mic.data_ready.clear()
+                continue
 
-            url = "wss://api.openai.com/v1/realtime?model=gpt-4o-realtime-preview-2024-10-01"
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "OpenAI-Beta": "realtime=v1",
-            }
+            audio_data = mic.read()
+            if audio_data is not None:
+                yield audio_data
+    finally:
+        exit_wait.cancel()
 
-            mic = AsyncMicrophone()
-            visual_interface = VisualInterface()
 
-            async with websockets.connect(url, extra_headers=headers) as websocket:
+async def realtime_api():
+    if not API_KEY:
+        logger.error("Please set the OPENAI_API_KEY in your .env file.")
+        return
+
+    reconnect_attempts = 0
+    while True:
+        # Set by process_ws_messages once the server acknowledges the session
+        session_updated = asyncio.Event()
+        try:
+            exit_event = asyncio.Event()
+
+            # Tears everything down exactly once, in reverse order of setup
+            async with contextlib.AsyncExitStack() as stack:
+                visual_interface = VisualInterfaceProcess()
+                stack.push_async_callback(visual_interface.close)
+                mic = AsyncMicrophone()
+                stack.callback(mic.close)
+                websocket = await stack.enter_async_context(
+                    websockets.connect(
+                        REALTIME_URL,
+                        extra_headers=REALTIME_HEADERS,
+                        create_protocol=RealtimeClientProtocol,
+                        # Base64 PCM doesn't compress; skip the per-frame deflate pass
+                        compression=None,
+                        max_size=8 << 20,
+                        write_limit=1 << 20,
+                        ping_interval=20,
+                        ping_timeout=20,
+                    )
+                )
                 logger.info("Connected to the server.")
+                # Don't let Nagle hold back small audio frames
+                sock = websocket.transport.get_extra_info("socket")
+                if sock is not None:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                 # Initialize the session with voice capabilities and tools
                 session_update = {
                     "type": "session.update",
@@ -73,14 +174,15 @@ async def realtime_api():
                     },
                 }
                 log_ws_event("outgoing", session_update)
-                await websocket.send(json.dumps(session_update))
+                await websocket.send(orjson.dumps(session_update).decode())
 
                 ws_task = asyncio.create_task(
-                    process_ws_messages(websocket, mic, visual_interface)
-                )
-                visual_task = asyncio.create_task(
-                    run_visual_interface(visual_interface)
+                    process_ws_messages(
+                        websocket, mic, visual_interface, session_updated
+                    )
                 )
+                # Stop sending once the receive side ends, even if the mic is idle
+                ws_task.add_done_callback(lambda _: exit_event.set())
 
                 logger.info(
                     "Conversation started. Speak freely, and the assistant will respond."
@@ -88,65 +190,73 @@ async def realtime_api():
                 mic.start_recording()
                 logger.info("Recording started. Listening for speech...")
 
+                # Reused for every append event sent on this connection
+                append_scratch = bytearray(APPEND_PREFIX).ljust(APPEND_SCRATCH_SIZE)
+                audio_bytes_sent = 0
+                audio_appends_sent = 0
                 try:
-                    while not exit_event.is_set():
-                        await asyncio.sleep(0.01)  # Small delay to reduce CPU usage
-                        if not mic.is_receiving:
-                            audio_data = mic.get_audio_data()
-                            if audio_data:
-                                base64_audio = base64_encode_audio(audio_data)
-                                if base64_audio:
-                                    audio_event = {
-                                        "type": "input_audio_buffer.append",
-                                        "audio": base64_audio,
-                                    }
-                                    log_ws_event("outgoing", audio_event)
-                                    await websocket.send(json.dumps(audio_event))
-                                    # Update energy for visualization
-                                    visual_interface.process_audio_data(audio_data)
-                                else:
-                                    logger.debug("No audio data to send")
+                    async for audio_data in _drain(mic, exit_event, websocket):
+                        if logger.isEnabledFor(logging.DEBUG):
+                            log_ws_event("outgoing", APPEND_EVENT)
+                        with _encode_append_event(
+                            append_scratch, audio_data
+                        ) as append_event:
+                            await websocket.send_text(append_event)
+                        audio_bytes_sent += audio_data.nbytes
+                        audio_appends_sent += 1
+                        # Update energy for visualization
+                        visual_interface.process_audio_data(audio_data)
                 except KeyboardInterrupt:
                     logger.info("Keyboard interrupt received. Closing the connection.")
+                except ConnectionClosedError:
+                    pass  # Raised again below, once the session is torn down
                 except Exception as e:
                     logger.exception(
                         f"An unexpected error occurred in the main loop: {e}"
                     )
                 finally:
                     exit_event.set()
+                    logger.info(
+                        f"Sent {audio_bytes_sent} bytes of audio in {audio_appends_sent} appends"
+                    )
                     mic.stop_recording()
-                    mic.close()
+                    # Close now rather than on stack exit so ws_task can finish
                     await websocket.close()
                     visual_interface.set_active(False)
 
                 # Wait for the WebSocket processing task to complete
                 try:
                     await ws_task
-                    await visual_task
                 except Exception as e:
                     logging.exception(f"Error in WebSocket processing task: {e}")
 
+                # Both sides swallow a lost connection; surface it so the
+                # reconnect logic below runs instead of ending the program
+                closed = websocket.connection_closed_exc()
+                if isinstance(closed, ConnectionClosedError):
+                    raise closed
+
             # If execution reaches here without exceptions, exit the loop
             break
         except ConnectionClosedError as e:
             if "keepalive ping timeout" in str(e):
+                if session_updated.is_set():
+                    reconnect_attempts = 0
+                # Exponential backoff with jitter, capped at 30 seconds
+                delay = min(30.0, 0.25 * 2**reconnect_attempts)
+                delay += random.uniform(0, 0.25)
+                reconnect_attempts += 1
                 logging.warning(
-                    "WebSocket connection lost due to keepalive ping timeout. Reconnecting..."
+                    "WebSocket connection lost due to keepalive ping timeout. "
+                    f"Reconnecting in {delay:.2f}s..."
                 )
-                await asyncio.sleep(1)  # Wait before reconnecting
+                await asyncio.sleep(delay)
                 continue  # Retry the connection
             logging.exception("WebSocket connection closed unexpectedly.")
             break  # Exit the loop on other connection errors
         except Exception as e:
             logging.exception(f"An unexpected error occurred: {e}")
             break  # Exit the loop on unexpected exceptions
-        finally:
-            if "mic" in locals():
-                mic.stop_recording()
-                mic.close()
-            if "websocket" in locals():
-                await websocket.close()
-            pygame.quit()
 
 
 async def main_async():
@@ -154,8 +264,14 @@ async def main_async():
 
 
 def main():
+    loop_factory = None
+    if sys.platform != "win32":
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+
     try:
-        asyncio.run(main_async())
+        asyncio.run(main_async(), loop_factory=loop_factory)
     except KeyboardInterrupt:
         logger.info("Program terminated by user")
     except Exception as e:
@@ -1,11 +1,19 @@
 # src/voice_assistant/microphone.py
+import asyncio
 import logging
-import queue
-from typing import Optional
+import threading
+import time
 
+import numpy as np
 import pyaudio
 
-from voice_assistant.config import CHANNELS, CHUNK, FORMAT, RATE
+from voice_assistant.config import (
+    CHANNELS,
+    CHUNK,
+    FORMAT,
+    MAX_AUDIO_BACKLOG_BYTES,
+    RATE,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,17 +29,88 @@ class AsyncMicrophone:
             frames_per_buffer=CHUNK,
             stream_callback=self.callback,
         )
-        self.queue = queue.Queue()
+        # Ring buffer holding two seconds of samples. The PortAudio thread
+        # writes at _w, the event loop reads from _r; both only ever grow and
+        # are reduced modulo the buffer size when indexing.
+        self._buf = np.zeros(RATE * CHANNELS * 2, dtype=np.int16)
+        self._w = 0
+        self._r = 0
+        self._lock = threading.Lock()
+        self._max_backlog = MAX_AUDIO_BACKLOG_BYTES // self._buf.itemsize
+        # read() copies into this instead of allocating a new array every call
+        self._out = np.empty(self._max_backlog, dtype=np.int16)
+        self.dropped_bytes = 0
+        self._dropped_logged = 0
+        self._last_drop_log = 0.0
+        self.data_ready = asyncio.Event()
+        self.loop: asyncio.AbstractEventLoop | None = None
         self.is_recording = False
         self.is_receiving = False
         logger.info("AsyncMicrophone initialized")
 
     def callback(self, in_data, frame_count, time_info, status):
+        # Runs on the PortAudio thread: copy into the ring, then wake the loop
         if self.is_recording and not self.is_receiving:
-            self.queue.put(in_data)
+            self._write(np.frombuffer(in_data, dtype=np.int16))
+            self.loop.call_soon_threadsafe(self.data_ready.set)
         return (None, pyaudio.paContinue)
 
+    def _write(self, samples: np.ndarray):
+        size = len(self._buf)
+        # Only the newest size samples can fit; the rest count as dropped below
+        skipped = max(0, len(samples) - size)
+        samples = samples[skipped:]
+        n = len(samples)
+        with self._lock:
+            self._w += skipped
+            start = self._w % size
+            first = min(n, size - start)
+            self._buf[start : start + first] = samples[:first]
+            self._buf[: n - first] = samples[first:]
+            self._w += n
+            # Drop the oldest audio rather than let send latency grow unbounded
+            backlog = self._w - self._r
+            if backlog > self._max_backlog:
+                self._r = self._w - self._max_backlog
+                self.dropped_bytes += (backlog - self._max_backlog) * self._buf.itemsize
+
+    @property
+    def buffered_bytes(self) -> int:
+        return (self._w - self._r) * self._buf.itemsize
+
+    def log_dropped(self):
+        """Log audio dropped under backpressure, at most once per second."""
+        now = time.monotonic()
+        if self.dropped_bytes == self._dropped_logged or now - self._last_drop_log < 1:
+            return
+        logger.info(
+            f"Dropped {self.dropped_bytes - self._dropped_logged} bytes of stale mic "
+            f"audio ({self.dropped_bytes} total)"
+        )
+        self._dropped_logged = self.dropped_bytes
+        self._last_drop_log = now
+
+    def read(self) -> np.ndarray | None:
+        """Return all buffered samples as one contiguous array.
+
+        The array is a view of a buffer reused by the next read() call.
+        """
+        self.data_ready.clear()
+        size = len(self._buf)
+        with self._lock:
+            n = self._w - self._r
+            if not n:
+                return None
+            start = self._r % size
+            self._r = self._w
+            first = min(n, size - start)
+            out = self._out[:n]
+            out[:first] = self._buf[start : start + first]
+            out[first:] = self._buf[: n - first]
+            return out
+
     def start_recording(self):
+        self.loop = asyncio.get_running_loop()
         self.is_recording = True
         logger.info("Started recording")
 
@@ -48,12 +127,6 @@ class AsyncMicrophone:
         self.is_receiving = False
         logger.info("Stopped receiving assistant response")
 
-    def get_audio_data(self) -> Optional[bytes]:
-        data = b""
-        while not self.queue.empty():
-            data += self.queue.get()
-        return data if data else None
-
     def close(self):
         self.stream.stop_stream()
         self.stream.close()
@@ -0,0 +1,72 @@
+import importlib
+import sys
+import types
+from unittest import mock
+
+import numpy as np
+import pytest
+
+# Tiny sizes so the wrap-around cases are easy to follow: the ring holds
+# RATE * CHANNELS * 2 = 16 samples and the backlog is capped at 10 samples.
+RATE = 8
+CHANNELS = 1
+MAX_BACKLOG_SAMPLES = 10
+
+
+@pytest.fixture
+def mic(monkeypatch):
+    pyaudio = types.ModuleType("pyaudio")
+    pyaudio.PyAudio = mock.MagicMock
+    pyaudio.paContinue = 0
+    pyaudio.paInt16 = 8
+    config = types.ModuleType("voice_assistant.config")
+    config.CHANNELS = CHANNELS
+    config.CHUNK = 4
+    config.FORMAT = pyaudio.paInt16
+    config.MAX_AUDIO_BACKLOG_BYTES = MAX_BACKLOG_SAMPLES * 2
+    config.RATE = RATE
+    monkeypatch.setitem(sys.modules, "pyaudio", pyaudio)
+    monkeypatch.setitem(sys.modules, "voice_assistant.config", config)
+    monkeypatch.delitem(sys.modules, "voice_assistant.microphone", raising=False)
+    microphone = importlib.import_module("voice_assistant.microphone")
+    yield microphone.AsyncMicrophone()
+    sys.modules.pop("voice_assistant.microphone", None)
+
+
+def samples(start, stop):
+    return np.arange(start, stop, dtype=np.int16)
+
+
+def test_read_returns_none_when_empty(mic):
+    assert mic.read() is None
+    mic._write(samples(0, 3))
+    mic.read()
+    assert mic.read() is None
+
+
+def test_write_straddling_buffer_end(mic):
+    # Move both positions near the end of the 16-sample ring
+    mic._write(samples(0, 7))
+    mic.read()
+    mic._write(samples(100, 107))
+    mic.read()
+    mic._write(samples(200, 205))
+    assert mic._w % len(mic._buf) < mic._r % len(mic._buf)
+    np.testing.assert_array_equal(mic.read(), samples(200, 205))
+    assert mic.dropped_bytes == 0
+
+
+def test_overflow_keeps_newest_samples(mic):
+    mic._write(samples(0, 6))
+    mic._write(samples(6, 14))
+    assert mic.buffered_bytes == MAX_BACKLOG_SAMPLES * 2
+    assert mic.dropped_bytes == (14 - MAX_BACKLOG_SAMPLES) * 2
+    np.testing.assert_array_equal(mic.read(), samples(4, 14))
+
+
+def test_write_larger_than_ring(mic):
+    mic._write(samples(0, 3))
+    mic._write(samples(3, 40))
+    assert mic.dropped_bytes == (40 - MAX_BACKLOG_SAMPLES) * 2
+    np.testing.assert_array_equal(mic.read(), samples(30, 40))
+    assert mic.read() is None
@@ -0,0 +1,173 @@
+import asyncio
+import contextlib
+import importlib
+import random
+import sys
+import types
+from unittest import mock
+
+import numpy as np
+import pytest
+from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
+from websockets.frames import Close
+
+PING_TIMEOUT = ConnectionClosedError(None, Close(1011, "keepalive ping timeout"))
+CLOSED_OK = ConnectionClosedOK(Close(1000, ""), Close(1000, ""), True)
+
+
+class FakeWebSocket:
+    """Scripted connection: how it is lost and whether the session was acked."""
+
+    def __init__(self, closed_exc, session_acked=False, fail_send=False):
+        self.closed_exc = closed_exc
+        self.session_acked = session_acked
+        self.fail_send = fail_send
+        self.closed = asyncio.Event()
+        self.transport = mock.Mock()
+        self.transport.get_write_buffer_size.return_value = 0
+        self.transport.get_extra_info.return_value = None
+
+    async def send(self, data):
+        pass
+
+    async def send_text(self, data):
+        if self.fail_send:
+            raise self.closed_exc
+
+    async def close(self):
+        self.closed.set()
+
+    def connection_closed_exc(self):
+        return self.closed_exc
+
+
+async def fake_process_ws_messages(websocket, mic, visual_interface, session_updated):
+    if websocket.session_acked:
+        session_updated.set()
+    # Like the real handler, return quietly once the connection is gone
+    if websocket.fail_send:
+        await websocket.closed.wait()
+
+
+class FakeMicrophone:
+    def __init__(self):
+        self.data_ready = asyncio.Event()
+        self.buffered_bytes = 0
+
+    def start_recording(self):
+        self.data_ready.set()
+
+    def read(self):
+        self.data_ready.clear()
+        return np.zeros(160, dtype=np.int16)
+
+    def log_dropped(self):
+        pass
+
+    def stop_recording(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeVisualInterface:
+    def set_active(self, is_active):
+        pass
+
+    def process_audio_data(self, samples):
+        pass
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def main(monkeypatch):
+    config = types.ModuleType("voice_assistant.config")
+    config.AUDIO_BATCH_BYTES = 3200
+    config.AUDIO_BATCH_MAX_DELAY = 0
+    config.MAX_AUDIO_BACKLOG_BYTES = 16000
+    config.PREFIX_PADDING_MS = 300
+    config.SESSION_INSTRUCTIONS = ""
+    config.SILENCE_DURATION_MS = 500
+    config.SILENCE_THRESHOLD = 0.5
+    stubs = {
+        "voice_assistant.config": config,
+        "voice_assistant.microphone": types.SimpleNamespace(
+            AsyncMicrophone=FakeMicrophone
+        ),
+        "voice_assistant.tools": types.SimpleNamespace(TOOL_SCHEMAS=[]),
+        "voice_assistant.utils.log_utils": types.SimpleNamespace(
+            log_ws_event=lambda direction, event: None
+        ),
+        "voice_assistant.visual_interface": types.SimpleNamespace(
+            VisualInterfaceProcess=FakeVisualInterface
+        ),
+        "voice_assistant.websocket_handler": types.SimpleNamespace(
+            RealtimeClientProtocol=None,
+            process_ws_messages=fake_process_ws_messages,
+        ),
+    }
+    for name, module in stubs.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.delitem(sys.modules, "voice_assistant.main", raising=False)
+    module = importlib.import_module("voice_assistant.main")
+    monkeypatch.setattr(module, "API_KEY", "test")
+    monkeypatch.setattr(random, "uniform", lambda a, b: 0)
+    yield module
+    sys.modules.pop("voice_assistant.main", None)
+
+
+def run_sessions(main, monkeypatch, sessions):
+    """Run realtime_api over the scripted sessions; return the backoff delays."""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay, *args):
+        delays.append(delay)
+        await real_sleep(0)
+
+    @contextlib.asynccontextmanager
+    async def connect(*args, **kwargs):
+        yield remaining.pop(0)()
+
+    remaining = list(sessions)
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    monkeypatch.setattr(main, "websockets", types.SimpleNamespace(connect=connect))
+    asyncio.run(asyncio.wait_for(main.realtime_api(), timeout=5))
+    assert not remaining
+    return delays
+
+
+def test_ping_timeout_reconnects_with_backoff(main, monkeypatch):
+    delays = run_sessions(
+        main,
+        monkeypatch,
+        [
+            # Receive side notices the lost connection first
+            lambda: FakeWebSocket(PING_TIMEOUT),
+            # Sending audio notices it first
+            lambda: FakeWebSocket(PING_TIMEOUT, fail_send=True),
+            # A session that got going resets the backoff
+            lambda: FakeWebSocket(PING_TIMEOUT, session_acked=True),
+            lambda: FakeWebSocket(PING_TIMEOUT),
+            lambda: FakeWebSocket(CLOSED_OK, session_acked=True),
+        ],
+    )
+    assert delays == [0.25, 0.5, 0.25, 0.5]
+
+
+def test_backoff_is_capped(main, monkeypatch):
+    sessions = [lambda: FakeWebSocket(PING_TIMEOUT)] * 10
+    delays = run_sessions(
+        main, monkeypatch, [*sessions, lambda: FakeWebSocket(CLOSED_OK)]
+    )
+    assert delays[-1] == 30.0
+    assert delays[:3] == [0.25, 0.5, 1.0]
+
+
+def test_other_close_errors_do_not_reconnect(main, monkeypatch):
+    server_error = ConnectionClosedError(Close(1011, "server error"), None)
+    delays = run_sessions(main, monkeypatch, [lambda: FakeWebSocket(server_error)])
+    assert delays == []
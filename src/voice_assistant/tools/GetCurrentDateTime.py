@@ -1,14 +1,18 @@
 import asyncio
-from datetime import datetime
+import time
 
 from agency_swarm.tools import BaseTool
 
 
+def _now_str() -> str:
+    return time.strftime("%A, %Y-%m-%d %H:%M:%S", time.localtime())
+
+
 class GetCurrentDateTime(BaseTool):
     """A tool to get the current date, time, and day of the week."""
 
     async def run(self) -> str:
-        return datetime.now().strftime("%A, %Y-%m-%d %H:%M:%S")
+        return _now_str()
 
 
 if __name__ == "__main__":
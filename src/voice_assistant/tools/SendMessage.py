@@ -9,7 +9,12 @@ import asyncio
 from agency_swarm.tools import BaseTool
 from pydantic import Field
 
-from voice_assistant.agencies import AGENCIES, AGENCIES_AND_AGENTS_STRING
+from voice_assistant.agencies import (
+    AGENCIES,
+    AGENCIES_AND_AGENTS_STRING,
+    AGENCY_AGENT_INDEX,
+    AGENCY_AGENT_NAMES,
+)
 from voice_assistant.utils.decorators import timeit_decorator
 
 
@@ -51,12 +56,11 @@ class SendMessage(BaseTool):
         if agency:
             recipient_agent = None
             if self.agent_name:
-                recipient_agent = next(
-                    (agent for agent in agency.agents if agent.name == self.agent_name),
-                    None,
+                recipient_agent = AGENCY_AGENT_INDEX[self.agency_name].get(
+                    self.agent_name
                 )
                 if not recipient_agent:
-                    return f"Agent '{self.agent_name}' not found in agency '{self.agency_name}'. Available agents: {', '.join(agent.name for agent in agency.agents)}"
+                    return f"Agent '{self.agent_name}' not found in agency '{self.agency_name}'. Available agents: {AGENCY_AGENT_NAMES[self.agency_name]}"
             else:
                 recipient_agent = None
 
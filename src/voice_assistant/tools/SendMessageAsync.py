@@ -5,7 +5,11 @@ To use this tool, provide the message you want to send, the name of the agency t
 """
 
 import asyncio
+import atexit
+import concurrent.futures
+import functools
 import logging
+import os
 
 from agency_swarm.agency import Agency
 from agency_swarm.threads import Thread
@@ -13,11 +17,23 @@ from agency_swarm.threads.thread_async import ThreadAsync
 from agency_swarm.tools import BaseTool
 from pydantic import Field
 
-from voice_assistant.agencies import AGENCIES, AGENCIES_AND_AGENTS_STRING
+from voice_assistant.agencies import (
+    AGENCIES,
+    AGENCIES_AND_AGENTS_STRING,
+    AGENCY_AGENT_INDEX,
+    AGENCY_AGENT_NAMES,
+)
 from voice_assistant.utils.decorators import timeit_decorator
 
 logger = logging.getLogger(__name__)
 
+# Bounded pool so concurrent sends reuse threads instead of spawning new ones
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("AGENCY_WORKERS", "4")),
+    thread_name_prefix="agency",
+)
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
 
 class SendMessageAsync(BaseTool):
     """
@@ -52,29 +68,34 @@ class SendMessageAsync(BaseTool):
 
         if not self.agent_name or self.agent_name == agency.ceo.name:
             thread: Thread = agency.main_thread
+            recipient_agent = None
         else:
-            recipient_agent = next(
-                (agent for agent in agency.agents if agent.name == self.agent_name),
-                None,
-            )
+            recipient_agent = AGENCY_AGENT_INDEX[self.agency_name].get(self.agent_name)
             if not recipient_agent:
-                return f"Agent '{self.agent_name}' not found in agency '{self.agency_name}'. Available agents: {', '.join(agent.name for agent in agency.agents)}"
+                return f"Agent '{self.agent_name}' not found in agency '{self.agency_name}'. Available agents: {AGENCY_AGENT_NAMES[self.agency_name]}"
 
             thread: Thread = agency.agents_and_threads.get(agency.ceo.name, {}).get(
                 self.agent_name
             )
 
+        loop = asyncio.get_running_loop()
         if isinstance(thread, ThreadAsync):
-            return await asyncio.to_thread(
-                thread.get_completion_async,
-                message=self.message,
-                recipient_agent=recipient_agent,
+            return await loop.run_in_executor(
+                _EXECUTOR,
+                functools.partial(
+                    thread.get_completion_async,
+                    message=self.message,
+                    recipient_agent=recipient_agent,
+                ),
             )
         else:
-            await asyncio.to_thread(
-                thread.get_completion,
-                message=self.message,
-                recipient_agent=recipient_agent,
+            await loop.run_in_executor(
+                _EXECUTOR,
+                functools.partial(
+                    thread.get_completion,
+                    message=self.message,
+                    recipient_agent=recipient_agent,
+                ),
             )
         return f"Message sent asynchronously. Use 'GetResponse' to check status."
 
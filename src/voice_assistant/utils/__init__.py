@@ -1,5 +0,0 @@
-import base64
-
-
-def base64_encode_audio(audio_bytes: bytes) -> str:
-    return base64.b64encode(audio_bytes).decode("utf-8")
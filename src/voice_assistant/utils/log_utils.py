@@ -20,41 +20,50 @@ def log_runtime(function_or_name: str, duration: float):
     logger.info(f"⏰ {function_or_name}() took {duration:.4f} seconds")
 
 
+EVENT_EMOJIS = {
+    "session.update": "🛠️",
+    "session.created": "🔌",
+    "session.updated": "🔄",
+    "input_audio_buffer.append": "🎤",
+    "input_audio_buffer.commit": "✅",
+    "input_audio_buffer.speech_started": "🗣️",
+    "input_audio_buffer.speech_stopped": "🤫",
+    "input_audio_buffer.cleared": "🧹",
+    "input_audio_buffer.committed": "📨",
+    "conversation.item.create": "📥",
+    "conversation.item.delete": "🗑️",
+    "conversation.item.truncate": "✂️",
+    "conversation.item.created": "📤",
+    "conversation.item.deleted": "🗑️",
+    "conversation.item.truncated": "✂️",
+    "response.create": "➡️",
+    "response.created": "📝",
+    "response.output_item.added": "➕",
+    "response.output_item.done": "✅",
+    "response.text.delta": "✍️",
+    "response.text.done": "📝",
+    "response.audio.delta": "🔊",
+    "response.audio.done": "🔇",
+    "response.done": "✔️",
+    "response.cancel": "⛔",
+    "response.function_call_arguments.delta": "📥",
+    "response.function_call_arguments.done": "📥",
+    "rate_limits.updated": "⏳",
+    "error": "❌",
+    "conversation.item.input_audio_transcription.completed": "📝",
+    "conversation.item.input_audio_transcription.failed": "⚠️",
+}
+
+# Audio chunks stream many times per second, so they are only logged at DEBUG
+HIGH_FREQUENCY_EVENTS = {"input_audio_buffer.append", "response.audio.delta"}
+
+
 def log_ws_event(direction: str, event: dict):
     event_type = event.get("type", "Unknown")
-    event_emojis = {
-        "session.update": "🛠️",
-        "session.created": "🔌",
-        "session.updated": "🔄",
-        "input_audio_buffer.append": "🎤",
-        "input_audio_buffer.commit": "✅",
-        "input_audio_buffer.speech_started": "🗣️",
-        "input_audio_buffer.speech_stopped": "🤫",
-        "input_audio_buffer.cleared": "🧹",
-        "input_audio_buffer.committed": "📨",
-        "conversation.item.create": "📥",
-        "conversation.item.delete": "🗑️",
-        "conversation.item.truncate": "✂️",
-        "conversation.item.created": "📤",
-        "conversation.item.deleted": "🗑️",
-        "conversation.item.truncated": "✂️",
-        "response.create": "➡️",
-        "response.created": "📝",
-        "response.output_item.added": "➕",
-        "response.output_item.done": "✅",
-        "response.text.delta": "✍️",
-        "response.text.done": "📝",
-        "response.audio.delta": "🔊",
-        "response.audio.done": "🔇",
-        "response.done": "✔️",
-        "response.cancel": "⛔",
-        "response.function_call_arguments.delta": "📥",
-        "response.function_call_arguments.done": "📥",
-        "rate_limits.updated": "⏳",
-        "error": "❌",
-        "conversation.item.input_audio_transcription.completed": "📝",
-        "conversation.item.input_audio_transcription.failed": "⚠️",
-    }
-    emoji = event_emojis.get(event_type, "❓")
+    level = logging.DEBUG if event_type in HIGH_FREQUENCY_EVENTS else logging.INFO
+    if not logger.isEnabledFor(level):
+        return
+
+    emoji = EVENT_EMOJIS.get(event_type, "❓")
     icon = "⬆️ - Out" if direction.lower() == "outgoing" else "⬇️ - In"
-    logger.info(f"{emoji} {icon} {event_type}")
+    logger.log(level, f"{emoji} {icon} {event_type}")
@@ -1,10 +1,30 @@
 import asyncio
 import os
+import subprocess
+import sys
 from collections import deque
+from multiprocessing import resource_tracker, shared_memory
 
 import numpy as np
 import pygame
 
+# Scales int16 samples to [-1.0, 1.0)
+_INT16_SCALE = 1.0 / 32768.0
+
+# Shared memory layout: an int64 header followed by a float32 ring of energies
+_WRITE_INDEX, _IS_ACTIVE, _IS_ASSISTANT_SPEAKING, _RUNNING = range(4)
+_HEADER_FIELDS = 4
+_ENERGY_RING_SIZE = 64
+_SHM_SIZE = _HEADER_FIELDS * 8 + _ENERGY_RING_SIZE * 4
+
+
+def _shared_views(buf) -> tuple[np.ndarray, np.ndarray]:
+    header = np.ndarray((_HEADER_FIELDS,), dtype=np.int64, buffer=buf)
+    ring = np.ndarray(
+        (_ENERGY_RING_SIZE,), dtype=np.float32, buffer=buf, offset=_HEADER_FIELDS * 8
+    )
+    return header, ring
+
 
 class VisualInterface:
     def __init__(self, width=400, height=400):
@@ -29,7 +49,7 @@ class VisualInterface:
         self.current_radius = self.base_radius
         self.energy_queue = deque(maxlen=50)  # Store last 50 energy values
         self.update_interval = 0.05  # Update every 50ms
-        self.max_energy = 1.0  # Initial max energy value
+        self.max_energy = _INT16_SCALE  # Initial max energy value (one LSB)
 
     async def update(self):
         for event in pygame.event.get():
@@ -93,14 +113,87 @@ class VisualInterface:
         elif len(self.energy_queue) == self.energy_queue.maxlen:
             self.max_energy = max(self.energy_queue)
 
-    def process_audio_data(self, audio_data: bytes):
-        """Process and update audio energy for visualization."""
-        audio_frame = np.frombuffer(audio_data, dtype=np.int16)
-        energy = np.abs(audio_frame).mean()
-        self.update_energy(energy)
 
+class VisualInterfaceProcess:
+    """Runs VisualInterface in a child process, fed through shared memory.
+
+    Keeps pygame rendering off the main process's GIL. Only the energy of
+    each audio block and the activity flags cross the process boundary.
+    """
+
+    def __init__(self):
+        self.shm = shared_memory.SharedMemory(create=True, size=_SHM_SIZE)
+        self.header, self.ring = _shared_views(self.shm.buf)
+        self.header[:] = 0
+        self.header[_RUNNING] = 1
+        # Run this module directly so the child doesn't re-import the parent's
+        # __main__ (and with it the agencies and audio devices)
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "voice_assistant.visual_interface", self.shm.name]
+        )
+
+    def set_active(self, is_active):
+        self.header[_IS_ACTIVE] = is_active
 
-async def run_visual_interface(interface):
-    while True:
+    def set_assistant_speaking(self, is_speaking):
+        self.header[_IS_ASSISTANT_SPEAKING] = is_speaking
+
+    def process_audio_data(self, samples: np.ndarray):
+        """Publish the RMS of a block of int16 samples to the visualizer."""
+        scaled = samples.astype(np.float32) * _INT16_SCALE
+        write_index = int(self.header[_WRITE_INDEX])
+        self.ring[write_index % _ENERGY_RING_SIZE] = np.sqrt(np.mean(scaled * scaled))
+        # Publish the index only after the value is in place
+        self.header[_WRITE_INDEX] = write_index + 1
+
+    async def close(self):
+        self.header[_RUNNING] = 0
+        try:
+            await asyncio.to_thread(self.process.wait, timeout=1)
+        except subprocess.TimeoutExpired:
+            self.process.terminate()
+            try:
+                await asyncio.to_thread(self.process.wait, timeout=1)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                await asyncio.to_thread(self.process.wait)
+        del self.header, self.ring
+        self.shm.close()
+        self.shm.unlink()
+
+
+async def _run_from_shared_memory(header: np.ndarray, ring: np.ndarray):
+    interface = VisualInterface()
+    read_index = 0
+    parent_pid = os.getppid()
+    # Also stop if the parent died without clearing _RUNNING
+    while header[_RUNNING] and os.getppid() == parent_pid:
+        write_index = int(header[_WRITE_INDEX])
+        # Skip anything already overwritten if rendering fell behind
+        read_index = max(read_index, write_index - _ENERGY_RING_SIZE)
+        for i in range(read_index, write_index):
+            interface.update_energy(float(ring[i % _ENERGY_RING_SIZE]))
+        read_index = write_index
+
+        interface.set_active(bool(header[_IS_ACTIVE]))
+        interface.set_assistant_speaking(bool(header[_IS_ASSISTANT_SPEAKING]))
         if not await interface.update():
             break
+
+
+def run_visual_interface_proc(shm_name: str):
+    """Entry point of the visualizer process."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    # The parent owns the segment; don't let this process's tracker unlink it
+    resource_tracker.unregister(shm._name, "shared_memory")
+    header, ring = _shared_views(shm.buf)
+    try:
+        asyncio.run(_run_from_shared_memory(header, ring))
+    finally:
+        del header, ring
+        shm.close()
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    run_visual_interface_proc(sys.argv[1])
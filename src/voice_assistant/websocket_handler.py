@@ -3,7 +3,11 @@ import json
 import logging
 import time
 
+import orjson
 import websockets
+from websockets.exceptions import ProtocolError
+from websockets.frames import OP_BINARY, OP_CONT, OP_TEXT
+from websockets.legacy.client import WebSocketClientProtocol
 
 from voice_assistant.audio import audio_player
 from voice_assistant.tools import TOOLS
@@ -12,7 +16,50 @@ from voice_assistant.utils.log_utils import log_runtime, log_ws_event
 logger = logging.getLogger(__name__)
 
 
-async def process_ws_messages(websocket, mic, visual_interface):
+class RealtimeClientProtocol(WebSocketClientProtocol):
+    """Client protocol that returns text messages as raw UTF-8 bytes.
+
+    Every message from the realtime API is parsed with orjson, which
+    validates UTF-8 while parsing, so decoding each frame to str first
+    only repeats that work.
+
+    Builds on internals of the legacy websockets implementation, which is why
+    websockets is pinned below 14.
+    """
+
+    async def read_message(self) -> bytes | None:
+        frame = await self.read_data_frame(max_size=self.max_size)
+        if frame is None:
+            return None
+        if frame.opcode not in (OP_TEXT, OP_BINARY):
+            raise ProtocolError("unexpected opcode")
+        if frame.fin:
+            return frame.data
+
+        fragments = [frame.data]
+        max_size = self.max_size
+        while not frame.fin:
+            if max_size is not None:
+                max_size -= len(frame.data)
+            frame = await self.read_data_frame(max_size=max_size)
+            if frame is None:
+                raise ProtocolError("incomplete fragmented message")
+            if frame.opcode != OP_CONT:
+                raise ProtocolError("unexpected opcode")
+            fragments.append(frame.data)
+        return b"".join(fragments)
+
+    async def send_text(self, data: bytes | bytearray | memoryview):
+        """Send already UTF-8 encoded data as a single text frame.
+
+        The frame is masked into a new buffer before this returns control to
+        the event loop, so the caller may reuse data once it has been awaited.
+        """
+        await self.ensure_open()
+        await self.write_frame(True, OP_TEXT, data)
+
+
+async def process_ws_messages(websocket, mic, visual_interface, session_updated):
     assistant_reply = ""
     function_call = None
     function_call_args = ""
@@ -21,12 +68,14 @@ async def process_ws_messages(websocket, mic, visual_interface):
     while True:
         try:
             message = await websocket.recv()
-            event = json.loads(message)
+            event = orjson.loads(message)
             log_ws_event("incoming", event)
 
             event_type = event.get("type")
 
-            if event_type == "response.created":
+            if event_type == "session.updated":
+                session_updated.set()
+            elif event_type == "response.created":
                 mic.start_receiving()
                 visual_interface.set_active(True)
             elif event_type == "response.output_item.added":